@@ -1,22 +1,82 @@
-from fastapi import HTTPException
+from fastapi import HTTPException, Header
 from jose import jwt, JWTError
+from collections import OrderedDict
+import hashlib
 import os
+import time
 from dotenv import load_dotenv
+from database import get_user_collection
+from schemas import UserResponse
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
+_ALGORITHMS = [ALGORITHM]
 
-def verify_token(token: str):
+# short-lived cache of token -> resolved user, so repeated requests with the
+# same bearer token skip the JWT decode and the Mongo lookup
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 30))
+USER_CACHE_MAXSIZE = int(os.getenv("USER_CACHE_MAXSIZE", 4096))
+
+_user_cache: "OrderedDict[bytes, tuple[float, UserResponse]]" = OrderedDict()
+
+def _cache_key(token: str) -> bytes:
+    # keyed by digest so raw bearer tokens are not held in memory
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+def decode_token(token: str):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email = payload.get("sub")
-        if not email:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=_ALGORITHMS)
+        if not payload.get("sub"):
             raise HTTPException(status_code=401, detail="Invalid token payload")
-        return email
+        return payload
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
     except Exception as e:
-        raise HTTPException(status_code=401, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=401, detail=str(e))
+
+def verify_token(token: str):
+    return decode_token(token)["sub"]
+
+def get_cached_user(token: str):
+    key = _cache_key(token)
+    entry = _user_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, user = entry
+    if expires_at <= time.monotonic():
+        _user_cache.pop(key, None)
+        return None
+    _user_cache.move_to_end(key)
+    return user
+
+def cache_user(token: str, user: UserResponse, exp: int | None = None):
+    # never keep a user cached past the expiry of the token that resolved it
+    ttl = USER_CACHE_TTL
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+    key = _cache_key(token)
+    _user_cache[key] = (time.monotonic() + ttl, user)
+    _user_cache.move_to_end(key)
+    if len(_user_cache) > USER_CACHE_MAXSIZE:
+        _user_cache.popitem(last=False)
+
+async def get_current_user(authorization: str = Header(...)):
+    # async so FastAPI runs it on the event loop rather than in the threadpool
+    token = authorization.split(" ")[1] if " " in authorization else authorization
+    cached = get_cached_user(token)
+    if cached is not None:
+        return cached
+
+    payload = decode_token(token)
+    users = get_user_collection()
+    user = await users.find_one({"email": payload["sub"]}, {"_id": 0, "email": 1, "username": 1})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    current_user = UserResponse.model_validate(user)
+    cache_user(token, current_user, payload.get("exp"))
+    return current_user
@@ -1,18 +1,37 @@
 import os
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 MONGO_DETAILS = os.getenv("MONGO_DETAILS")  # MongoDB URI
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 50))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 10))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300_000))
 
-client = AsyncIOMotorClient(MONGO_DETAILS)
+client = AsyncIOMotorClient(
+    MONGO_DETAILS,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+    serverSelectionTimeoutMS=3000,
+)
 default_db = client.get_default_database()
 db_name = default_db.name if default_db is not None else "Riskly"
 db = client[db_name]
 
+users_collection = db["users"]
+
 def get_user_collection():
-    return db["users"]
+    return users_collection
+
+async def ensure_indexes():
+    # register/login/me look users up by email or username
+    users = get_user_collection()
+    await users.create_index("email")
+    await users.create_index("username")
 
-print(f"✅ Connected to MongoDB: {client.address}")
-print(f"Using database: {db_name}")
\ No newline at end of file
+logger.info("Using database: %s", db_name)
@@ -1,14 +1,21 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from users import users_router
-from database import client
+from database import client, ensure_indexes
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(users_router)
 
 @app.get("/")
 async def root():
     return {"message": "✅ API is working"}
 
+@app.on_event("startup")
+async def warm_db_client():
+    # open the pool before the first request instead of during it
+    await client.admin.command("ping")
+    await ensure_indexes()
+
 @app.on_event("shutdown")
 def shutdown_db_client():
     client.close()